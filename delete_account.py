@@ -1,35 +1,74 @@
 import streamlit as st
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+import threading
 import firebase_admin
-from PIL import Image
 from firebase_admin import credentials, firestore, auth
+from google.api_core import retry
+from google.api_core.exceptions import DeadlineExceeded, ResourceExhausted, ServiceUnavailable
+from google.rpc import code_pb2
 from dotenv import load_dotenv
 import os
 import requests
-import io
+from requests.adapters import HTTPAdapter
 import base64
 
+
+# Load the favicon once per process rather than re-opening the file on every rerun
+@st.cache_data(show_spinner=False)
+def load_image_bytes(file_path):
+    with open(file_path, 'rb') as f:
+        return f.read()
+
+
 st.set_page_config(
     page_title="Quizdom - Ultimate Trivia Experience",
-    page_icon="./icon_small.png",
+    page_icon=load_image_bytes("./icon_small.png"),
     layout="wide"
 )
 
 
-# Initialize Firebase Admin SDK
-def initialize_firebase():
-    if 'firebase_db' not in st.session_state:
-        if not firebase_admin._apps:
-            cred_dict = dict(st.secrets["firebase_service_account"])
-            cred = credentials.Certificate(cred_dict)
-            firebase_admin.initialize_app(cred)
-        st.session_state.firebase_db = firestore.client()
+# Initialize Firebase Admin SDK once per process, shared by all sessions
+@st.cache_resource
+def get_db():
+    if not firebase_admin._apps:
+        cred_dict = dict(st.secrets["firebase_service_account"])
+        cred = credentials.Certificate(cred_dict)
+        firebase_admin.initialize_app(cred)
+    db = firestore.client()
+
+    # Open the gRPC channel in the background while the user is still logging in
+    threading.Thread(target=warm_up_firestore, args=(db,), daemon=True).start()
+
+    return db
+
 
-    return st.session_state.firebase_db
+def warm_up_firestore(db):
+    """Issue a cheap read so the first real Firestore request skips channel setup"""
+    try:
+        # An empty projection opens the channel without fetching any profile data
+        db.collection("users").select([]).limit(1).get()
+    except Exception:
+        pass  # Warm-up is best effort
+
+
+FIREBASE_AUTH_TIMEOUT = 10
 
 
-FIREBASE_WEB_API_KEY = st.secrets["FIREBASE_WEB_API_KEY"]
-FIREBASE_AUTH_URL = f"https://identitytoolkit.googleapis.com/v1/accounts:signInWithPassword?key={FIREBASE_WEB_API_KEY}"
+# Resolve the sign-in URL from secrets only when a login is attempted, once per process
+@st.cache_resource
+def get_auth_url():
+    api_key = st.secrets["FIREBASE_WEB_API_KEY"]
+    return f"https://identitytoolkit.googleapis.com/v1/accounts:signInWithPassword?key={api_key}"
+
+
+# Shared HTTP session so login requests reuse kept-alive connections.
+# It serves every user session in the process, so keep enough sockets for concurrent logins.
+@st.cache_resource
+def get_http_session():
+    session = requests.Session()
+    session.mount("https://", HTTPAdapter(pool_connections=8, pool_maxsize=32))
+    return session
 
 
 def authenticate_user(email, password):
@@ -41,7 +80,7 @@ def authenticate_user(email, password):
             "returnSecureToken": True
         }
 
-        response = requests.post(FIREBASE_AUTH_URL, json=payload)
+        response = get_http_session().post(get_auth_url(), json=payload, timeout=FIREBASE_AUTH_TIMEOUT)
 
         if response.status_code == 200:
             user_data = response.json()
@@ -65,107 +104,223 @@ def authenticate_user(email, password):
         }
 
 
+USER_INFO_FIELDS = ["name", "createdAt", "lastLogin"]
+
+
+# Cached per user so checkbox toggles on the deletion page don't re-read Firestore.
+# The leading underscore keeps Streamlit from hashing the client. Errors propagate,
+# so only successful reads are cached.
+@st.cache_data(ttl=300, show_spinner=False)
+def fetch_user_info(_db, user_id):
+    # Only fetch the fields shown on the deletion page
+    user_doc = _db.collection("users").document(user_id).get(field_paths=USER_INFO_FIELDS)
+    if user_doc.exists:
+        return user_doc.to_dict()
+    return None
+
+
 def get_user_info(db, user_id):
     """Get user information from Firestore"""
     try:
-        user_doc = db.collection("users").document(user_id).get()
-        if user_doc.exists:
-            return user_doc.to_dict()
-        return None
+        return fetch_user_info(db, user_id)
     except Exception as e:
         st.error(f"Error getting user info: {e}")
         return None
 
 
-def delete_user_from_auth(user_id):
-    """Delete user from Firebase Authentication"""
+def delete_user_from_auth(user_id, notices):
+    """Delete user from Firebase Authentication, recording messages for the page in notices"""
     try:
         auth.delete_user(user_id)
         return True
     except auth.UserNotFoundError:
-        st.warning("User not found in Firebase Authentication, but will still clean up Firestore data.")
+        notices.append(("warning", "User not found in Firebase Authentication, but will still clean up Firestore data."))
         return True
     except Exception as e:
-        st.error(f"Error deleting user from Firebase Auth: {e}")
+        notices.append(("error", f"Error deleting user from Firebase Auth: {e}"))
         return False
 
 
+# Users, statistics, and other collections that might contain user data, keyed by user id
+USER_DATA_COLLECTIONS = ("users", "userStatistics", "userPreferences", "gameHistory", "userAchievements")
+# Back off and retry transient commit failures, bounded so the script thread isn't held for long
+FIRESTORE_COMMIT_RETRY = retry.Retry(
+    predicate=retry.if_exception_type(DeadlineExceeded, ResourceExhausted, ServiceUnavailable),
+    deadline=30
+)
+
+
 def delete_user_firestore_data(db, user_id):
     """Delete all user data from Firestore collections"""
     try:
-        deleted_collections = []
+        # Deleting a missing document is a no-op, so skip the existence reads and
+        # clear every collection in one atomic commit (well under the 500 write limit)
+        batch = db.batch()
+        for name in USER_DATA_COLLECTIONS:
+            batch.delete(db.collection(name).document(user_id))
+        batch.commit(retry=FIRESTORE_COMMIT_RETRY)
+
+        return list(USER_DATA_COLLECTIONS)
+
+    except Exception as e:
+        raise Exception(f"Failed to delete user data from Firestore: {e}")
+
 
-        # Delete from users collection
-        user_doc = db.collection("users").document(user_id)
-        if user_doc.get().exists:
-            user_doc.delete()
-            deleted_collections.append("users")
+# Collections holding documents that reference the user, and the field that holds the user id.
+# These equality queries rely on Firestore's automatic single-field indexes; don't add
+# index exemptions for triviaRooms.createdBy or availablePlayers.userId, or deletion
+# turns into a scan of the whole collection.
+RELATED_DOCUMENT_QUERIES = (
+    ("triviaRooms", "createdBy"),  # Trivia rooms the user created
+    ("availablePlayers", "userId"),
+)
+RELATED_DELETE_MAX_WORKERS = 64
+# Retry only transient write failures, and few enough times (BulkWriter backs off attempts**2
+# seconds) that the script thread is held about as long as the per-user commit retry allows
+BULK_WRITER_MAX_ATTEMPTS = 5
+BULK_WRITER_RETRY_CODES = (
+    code_pb2.DEADLINE_EXCEEDED,
+    code_pb2.RESOURCE_EXHAUSTED,
+    code_pb2.ABORTED,
+    code_pb2.UNAVAILABLE,
+)
+
+
+def delete_documents_in_parallel(db, refs, errors):
+    """Delete the given document references concurrently, dispatching each as it arrives.
+
+    Returns how many deletes succeeded; failures are recorded in errors.
+    """
+    deleted = 0
+    lock = threading.Lock()
+
+    def record_success():
+        nonlocal deleted
+        with lock:
+            deleted += 1
 
-        # Delete from userStatistics collection
-        stats_doc = db.collection("userStatistics").document(user_id)
-        if stats_doc.get().exists:
-            stats_doc.delete()
-            deleted_collections.append("userStatistics")
+    if hasattr(db, "bulk_writer"):
+        # BulkWriter sends the deletes in parallel batches with built-in retries
+        bulk_writer = db.bulk_writer()
+        bulk_writer.on_write_result(lambda reference, result, writer: record_success())
 
-        # Optional: Delete from other collections that might contain user data
-        other_collections = ["userPreferences", "gameHistory", "userAchievements"]
+        def record_failure(failure, writer):
+            if failure.code in BULK_WRITER_RETRY_CODES and failure.attempts < BULK_WRITER_MAX_ATTEMPTS:
+                return True  # Retry
+            errors.append(f"{failure.operation.reference.path}: {failure.message}")
+            return False
 
-        for collection_name in other_collections:
+        bulk_writer.on_write_error(record_failure)
+        try:
+            for ref in refs:
+                bulk_writer.delete(ref)
+        except Exception as e:
+            errors.append(str(e))
+        finally:
+            # Send any partially filled batch and stop the writer's workers even if the stream failed
+            bulk_writer.close()
+    else:
+        # Older google-cloud-firestore releases have no BulkWriter
+        with ThreadPoolExecutor(max_workers=RELATED_DELETE_MAX_WORKERS) as executor:
+            futures = []
             try:
-                doc = db.collection(collection_name).document(user_id)
-                if doc.get().exists:
-                    doc.delete()
-                    deleted_collections.append(collection_name)
-            except Exception:
-                pass  # Collection might not exist
+                for ref in refs:
+                    futures.append(executor.submit(ref.delete))
+            except Exception as e:
+                errors.append(str(e))
+
+            for future in futures:
+                try:
+                    future.result()
+                    record_success()
+                except Exception as e:
+                    errors.append(str(e))
 
-        return deleted_collections
+    return deleted
 
-    except Exception as e:
-        raise Exception(f"Failed to delete user data from Firestore: {e}")
 
+def delete_user_documents(db, collection_name, field, user_id, errors):
+    """Delete documents whose field references the user, returning how many were deleted"""
+    # Stream the matches so deletes start while later result pages are still arriving.
+    # Only references are needed, so an empty projection skips downloading document bodies.
+    query = db.collection(collection_name).where(field, "==", user_id).select([])
+    return delete_documents_in_parallel(db, (doc.reference for doc in query.stream()), errors)
 
-def delete_user_related_documents(db, user_id):
-    """Delete documents in collections that reference the user"""
+
+def delete_user_related_documents(db, user_id, notices):
+    """Delete documents in collections that reference the user, recording messages for the page in notices"""
     try:
-        deleted_docs = 0
+        errors = []
 
-        # Delete from triviaRooms where user is involved
-        try:
-            trivia_rooms = db.collection("triviaRooms").where("createdBy", "==", user_id).get()
-            for room in trivia_rooms:
-                room.reference.delete()
-                deleted_docs += 1
-        except Exception:
-            pass
-
-        # Delete from availablePlayers
-        try:
-            available_players = db.collection("availablePlayers").where("userId", "==", user_id).get()
-            for player in available_players:
-                player.reference.delete()
-                deleted_docs += 1
-        except Exception:
-            pass
+        # Run all related-document queries concurrently so their round-trips overlap
+        with ThreadPoolExecutor(max_workers=len(RELATED_DOCUMENT_QUERIES)) as executor:
+            futures = [
+                executor.submit(delete_user_documents, db, collection_name, field, user_id, errors)
+                for collection_name, field in RELATED_DOCUMENT_QUERIES
+            ]
+            deleted_docs = sum(future.result() for future in futures)
+
+        if errors:
+            notices.append(("warning", f"Some user-related documents might not have been deleted: {'; '.join(errors)}"))
 
         return deleted_docs
 
     except Exception as e:
-        st.warning(f"Some user-related documents might not have been deleted: {e}")
+        notices.append(("warning", f"Some user-related documents might not have been deleted: {e}"))
         return 0
 
 
-def complete_user_deletion(db, user_id):
-    """Complete user deletion process"""
+def future_result(future, default, errors):
+    """Return the future's result, or default after recording its error"""
     try:
-        # Step 1: Delete from Firebase Authentication
-        auth_deleted = delete_user_from_auth(user_id)
+        return future.result()
+    except Exception as e:
+        errors.append(str(e))
+        return default
 
-        # Step 2: Delete user data from Firestore
-        deleted_collections = delete_user_firestore_data(db, user_id)
 
-        # Step 3: Delete user-related documents
-        related_docs_deleted = delete_user_related_documents(db, user_id)
+def complete_user_deletion(db, user_id):
+    """Complete user deletion process"""
+    try:
+        # The three deletion steps are independent, so run them concurrently.
+        # Streamlit elements can't be written from several threads at once, so the
+        # steps record their messages and the script thread renders them afterwards.
+        notices = []
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            # Step 1: Delete from Firebase Authentication
+            auth_future = executor.submit(delete_user_from_auth, user_id, notices)
+
+            # Step 2: Delete user data from Firestore
+            data_future = executor.submit(delete_user_firestore_data, db, user_id)
+
+            # Step 3: Delete user-related documents
+            related_future = executor.submit(delete_user_related_documents, db, user_id, notices)
+
+        for level, message in notices:
+            if level == "error":
+                st.error(message)
+            else:
+                st.warning(message)
+
+        # Collect every step's outcome so one failure doesn't hide the others
+        errors = []
+        auth_deleted = future_result(auth_future, False, errors)
+        deleted_collections = future_result(data_future, [], errors)
+        related_docs_deleted = future_result(related_future, 0, errors)
+
+        # delete_user_from_auth reports failure by returning False rather than raising
+        if not auth_deleted:
+            errors.append("Failed to delete user from Firebase Authentication")
+
+        if errors:
+            # Report what did get deleted too, since Auth deletion can't be undone
+            return {
+                "success": False,
+                "error": "; ".join(errors),
+                "auth_deleted": auth_deleted,
+                "collections_deleted": deleted_collections,
+                "related_docs_deleted": related_docs_deleted
+            }
 
         return {
             "success": True,
@@ -181,39 +336,33 @@ def complete_user_deletion(db, user_id):
         }
 
 
+@st.cache_data(show_spinner=False)
 def img_to_base64(file_path):
-    img = Image.open(file_path)
-    byte_arr = io.BytesIO()
-    img.save(byte_arr, format='PNG')
-    return base64.b64encode(byte_arr.getvalue()).decode()
-
-
-def home_page():
-    """Display the home page introducing Quizdom"""
-
-    # Hero Section
-    col1, col2 = st.columns([2, 3])
+    with open(file_path, 'rb') as f:
+        return base64.b64encode(f.read()).decode('ascii')
+
+
+# Cached because the main script re-executes on every rerun
+@st.cache_resource
+def icon_html(width, height, min_height, margin_top=None):
+    margin = f"\n        margin-top: {margin_top};" if margin_top else ""
+    return f"""
+    <div style="
+        display: flex;
+        justify-content: center;
+        align-items: center;
+        height: {height};
+        min-height: {min_height};{margin}
+    ">
+        <img src="data:image/png;base64,{img_to_base64('icon_transparent.png')}" 
+             width="{width}" 
+             style="display: block;">
+    </div>
+    """
 
-    with col1:
-        st.markdown(
-            f"""
-            <div style="
-                display: flex;
-                justify-content: center;
-                align-items: center;
-                height: 40vh;
-                min-height: 300px;
-            ">
-                <img src="data:image/png;base64,{img_to_base64('icon_transparent.png')}" 
-                     width="250" 
-                     style="display: block;">
-            </div>
-            """,
-            unsafe_allow_html=True
-        )
 
-    with col2:
-        st.markdown("""
+# Static home page content
+HOME_HERO_MD = """
         # 🏆 Welcome to Quizdom
         ## *The Ultimate Trivia Experience*
 
@@ -222,29 +371,15 @@ def home_page():
         Quizdom is an engaging multiplayer trivia game that brings knowledge and fun together. 
         Test your skills across multiple categories, compete in real-time battles, and climb 
         the leaderboards to prove you're the ultimate quiz master.
-        """)
-
-
-        st.link_button(label="📱 Download on Google Play", type="primary",url="https://play.google.com/store/apps/details?id=com.yinonhdev.quizdom", use_container_width=True)
-
-    st.markdown("---")
-
-    # Features Section
-    st.markdown("## 🌟 Game Features")
-
-    col1, col2, col3 = st.columns(3)
-
-    with col1:
-        st.markdown("""
+        """
+HOME_FEATURES_MODES_MD = """
         ### 🎯 Multiple Game Modes
         - **Solo Mode**: Practice and improve your skills
         - **Duel Mode**: 1v1 real-time battles
         - **Group Mode**: Compete with multiple players
         - **Bot Challenges**: Test your skills against AI
-        """)
-
-    with col2:
-        st.markdown("""
+        """
+HOME_FEATURES_CATEGORIES_MD = """
         ### 📚 Diverse Categories
         - Science & Nature
         - Entertainment & Movies
@@ -252,17 +387,109 @@ def home_page():
         - History & Geography
         - Art & Literature
         - And many more!
-        """)
-
-    with col3:
-        st.markdown("""
+        """
+HOME_FEATURES_ACHIEVEMENTS_MD = """
         ### 🏅 Achievement System
         - Unlock special achievements
         - Daily login rewards
         - Streak bonuses
         - Leaderboard rankings
         - Coin collection system
-        """)
+        """
+HOME_STEP_MODE_MD = """
+        ### 1️⃣ Choose Mode
+        Select your preferred game mode and difficulty level
+        """
+HOME_STEP_CATEGORY_MD = """
+        ### 2️⃣ Pick Category
+        Choose from dozens of trivia categories
+        """
+HOME_STEP_COMPETE_MD = """
+        ### 3️⃣ Compete
+        Answer questions quickly and accurately
+        """
+HOME_STEP_REWARDS_MD = """
+        ### 4️⃣ Win Rewards
+        Earn coins, achievements, and climb leaderboards
+        """
+HOME_ACCOUNT_MD = """
+        ### Privacy & Account Control
+
+        We respect your privacy and give you full control over your account data. 
+        You can manage your account settings directly in the app, or use our web portal 
+        for account deletion if needed.
+
+        **Account Features:**
+        - Profile customization
+        - Privacy settings
+        - Data export options
+        - Secure authentication
+        - Account deletion
+        """
+HOME_FOOTER_HTML = """
+    <div style="text-align: center; padding: 2rem 0; color: #666;">
+        <p><strong>Quizdom</strong> - Challenge Your Mind, Expand Your Knowledge</p>
+        <p>© 2025 Quizdom. All rights reserved.</p>
+        <p>
+            <a href="https://doc-hosting.flycricket.io/quizdom-privacy-policy/e95e1934-c14d-4c56-80ee-9a7dd0373cca/privacy" target="_blank" style="color: #00AFFF; text-decoration: none;">Privacy Policy</a> | 
+            <!-- <a href="#terms" style="color: #00AFFF; text-decoration: none;">Terms of Service</a> | -->
+            <a href="mailto:yinon.h21+quizdom@gmail.com" style="color: #00AFFF; text-decoration: none;">Contact Support</a>
+        </p>
+    </div>
+    """
+
+
+AUTH_SESSION_KEYS = ('authenticated', 'user_uid', 'user_email', 'user_token')
+
+
+# Navigation callbacks run before the script reruns, so a click costs one run instead of two
+def logout():
+    """Clear the authenticated session"""
+    for key in AUTH_SESSION_KEYS:
+        st.session_state.pop(key, None)
+
+
+def go_home():
+    """Navigate to the home page, clearing the auth session"""
+    st.session_state.page = "home"
+    logout()
+
+
+def go_to_deletion():
+    """Navigate to the account deletion page"""
+    st.session_state.page = "deletion"
+
+
+def home_page():
+    """Display the home page introducing Quizdom"""
+
+    # Hero Section
+    col1, col2 = st.columns([2, 3])
+
+    with col1:
+        st.markdown(icon_html(250, "40vh", "300px"), unsafe_allow_html=True)
+
+    with col2:
+        st.markdown(HOME_HERO_MD)
+
+
+        st.link_button(label="📱 Download on Google Play", type="primary",url="https://play.google.com/store/apps/details?id=com.yinonhdev.quizdom", use_container_width=True)
+
+    st.markdown("---")
+
+    # Features Section
+    st.markdown("## 🌟 Game Features")
+
+    col1, col2, col3 = st.columns(3)
+
+    with col1:
+        st.markdown(HOME_FEATURES_MODES_MD)
+
+    with col2:
+        st.markdown(HOME_FEATURES_CATEGORIES_MD)
+
+    with col3:
+        st.markdown(HOME_FEATURES_ACHIEVEMENTS_MD)
 
     st.markdown("---")
 
@@ -272,28 +499,16 @@ def home_page():
     col1, col2, col3, col4 = st.columns(4)
 
     with col1:
-        st.markdown("""
-        ### 1️⃣ Choose Mode
-        Select your preferred game mode and difficulty level
-        """)
+        st.markdown(HOME_STEP_MODE_MD)
 
     with col2:
-        st.markdown("""
-        ### 2️⃣ Pick Category
-        Choose from dozens of trivia categories
-        """)
+        st.markdown(HOME_STEP_CATEGORY_MD)
 
     with col3:
-        st.markdown("""
-        ### 3️⃣ Compete
-        Answer questions quickly and accurately
-        """)
+        st.markdown(HOME_STEP_COMPETE_MD)
 
     with col4:
-        st.markdown("""
-        ### 4️⃣ Win Rewards
-        Earn coins, achievements, and climb leaderboards
-        """)
+        st.markdown(HOME_STEP_REWARDS_MD)
 
     st.markdown("---")
 
@@ -319,26 +534,11 @@ def home_page():
     col1, col2 = st.columns([2, 1])
 
     with col1:
-        st.markdown("""
-        ### Privacy & Account Control
-
-        We respect your privacy and give you full control over your account data. 
-        You can manage your account settings directly in the app, or use our web portal 
-        for account deletion if needed.
-
-        **Account Features:**
-        - Profile customization
-        - Privacy settings
-        - Data export options
-        - Secure authentication
-        - Account deletion
-        """)
+        st.markdown(HOME_ACCOUNT_MD)
 
     with col2:
         st.markdown("### 🔐 Account Actions")
-        if st.button("🗑️ Delete Account", type="secondary", use_container_width=True):
-            st.session_state.page = "deletion"
-            st.rerun()
+        st.button("🗑️ Delete Account", type="secondary", use_container_width=True, on_click=go_to_deletion)
 
         if st.button("📧 Contact Support", use_container_width=True):
             st.info("📬 Support: yinon.h21+quizdom@gmail.com")
@@ -346,17 +546,7 @@ def home_page():
     st.markdown("---")
 
     # Footer
-    st.markdown("""
-    <div style="text-align: center; padding: 2rem 0; color: #666;">
-        <p><strong>Quizdom</strong> - Challenge Your Mind, Expand Your Knowledge</p>
-        <p>© 2025 Quizdom. All rights reserved.</p>
-        <p>
-            <a href="https://doc-hosting.flycricket.io/quizdom-privacy-policy/e95e1934-c14d-4c56-80ee-9a7dd0373cca/privacy" target="_blank" style="color: #00AFFF; text-decoration: none;">Privacy Policy</a> | 
-            <!-- <a href="#terms" style="color: #00AFFF; text-decoration: none;">Terms of Service</a> | -->
-            <a href="mailto:yinon.h21+quizdom@gmail.com" style="color: #00AFFF; text-decoration: none;">Contact Support</a>
-        </p>
-    </div>
-    """, unsafe_allow_html=True)
+    st.markdown(HOME_FOOTER_HTML, unsafe_allow_html=True)
 
 
 def login_page():
@@ -437,30 +627,42 @@ def login_page():
     """)
 
 
+POST_DELETION_REFRESH_SECONDS = 3
+TIMESTAMP_FORMAT = "%Y-%m-%d %H:%M"
+
+
+def format_timestamp(value):
+    """Format a Firestore timestamp or ISO 8601 string for display"""
+    # Firestore timestamps arrive as datetime subclasses, so skip the string round-trip
+    if isinstance(value, datetime):
+        return value.strftime(TIMESTAMP_FORMAT)
+    return datetime.fromisoformat(str(value)).strftime(TIMESTAMP_FORMAT)
+
+
+def show_deletion_summary(result):
+    """Display which parts of the account were deleted"""
+    st.subheader("Deletion Summary:")
+    col1, col2 = st.columns(2)
+
+    with col1:
+        st.write(f"**Authentication:** {'✅ Deleted' if result['auth_deleted'] else '❌ Failed'}")
+        st.write(f"**Collections cleared:** {len(result['collections_deleted'])}")
+        if result['collections_deleted']:
+            for collection in result['collections_deleted']:
+                st.write(f"  - {collection}")
+
+    with col2:
+        st.write(f"**Related documents deleted:** {result['related_docs_deleted']}")
+
+
 def deletion_page():
     """Display account deletion page for authenticated users"""
-    db = initialize_firebase()
+    db = get_db()
 
     col1, col2 = st.columns([1, 5])
 
     with col1:
-        st.markdown(
-            f"""
-                    <div style="
-                        display: flex;
-                        justify-content: center;
-                        align-items: center;
-                        height: 10vh;
-                        min-height: 200px;
-                        margin-top: -50px;
-                    ">
-                        <img src="data:image/png;base64,{img_to_base64('icon_transparent.png')}" 
-                             width="150" 
-                             style="display: block;">
-                    </div>
-                    """,
-            unsafe_allow_html=True
-        )
+        st.markdown(icon_html(150, "10vh", "200px", margin_top="-50px"), unsafe_allow_html=True)
 
     with col2:
         st.title("Delete Your Account")
@@ -469,20 +671,10 @@ def deletion_page():
     # Navigation buttons
     col_nav1, col_nav2 = st.columns([1, 1])
     with col_nav1:
-        if st.button("← Back to Home", type="secondary"):
-            st.session_state.page = "home"
-            # Clear auth session
-            for key in ['authenticated', 'user_uid', 'user_email', 'user_token']:
-                if key in st.session_state:
-                    del st.session_state[key]
-            st.rerun()
+        st.button("← Back to Home", type="secondary", on_click=go_home)
 
     with col_nav2:
-        if st.button("Logout", type="secondary"):
-            for key in ['authenticated', 'user_uid', 'user_email', 'user_token']:
-                if key in st.session_state:
-                    del st.session_state[key]
-            st.rerun()
+        st.button("Logout", type="secondary", on_click=logout)
 
     # Get and display user information
     user_info = get_user_info(db, st.session_state.user_uid)
@@ -502,9 +694,7 @@ def deletion_page():
             last_login = user_info.get('lastLogin')
             if last_login:
                 try:
-                    dt = datetime.fromisoformat(str(last_login))
-                    formatted_time = dt.strftime("%Y-%m-%d %H:%M")
-                    st.write(f"**Last Login:** {formatted_time}")
+                    st.write(f"**Last Login:** {format_timestamp(last_login)}")
                 except Exception as e:
                     st.write(f"**Last Login:** {last_login}")
                     st.warning(f"Couldn't format timestamp: {e}")
@@ -531,39 +721,36 @@ def deletion_page():
             with st.spinner("Deleting your account... Please wait."):
                 result = complete_user_deletion(db, st.session_state.user_uid)
 
+                # Don't keep the deleted profile in the process-wide cache
+                fetch_user_info.clear()
+
                 if result["success"]:
                     st.success("✅ Your account has been successfully deleted!")
-
-                    # Show deletion summary
-                    st.subheader("Deletion Summary:")
-                    col1, col2 = st.columns(2)
-
-                    with col1:
-                        st.write(f"**Authentication:** {'✅ Deleted' if result['auth_deleted'] else '❌ Failed'}")
-                        st.write(f"**Collections deleted:** {len(result['collections_deleted'])}")
-                        if result['collections_deleted']:
-                            for collection in result['collections_deleted']:
-                                st.write(f"  - {collection}")
-
-                    with col2:
-                        st.write(f"**Related documents deleted:** {result['related_docs_deleted']}")
-
+                    show_deletion_summary(result)
                     st.balloons()
 
-                    # Clear session after successful deletion
+                    # Clear session after successful deletion (user won't be able to login anyway)
                     st.info("You will be logged out automatically. Thank you for using our service.")
+                    logout()
 
-                    # Auto-logout after 3 seconds (user won't be able to login anyway)
-                    import time
-                    time.sleep(3)
-                    for key in ['authenticated', 'user_uid', 'user_email', 'user_token']:
-                        if key in st.session_state:
-                            del st.session_state[key]
-                    st.rerun()
+                    # Let the browser reload the app after a few seconds instead of blocking the script thread
+                    st.markdown(
+                        f'<meta http-equiv="refresh" content="{POST_DELETION_REFRESH_SECONDS}">',
+                        unsafe_allow_html=True
+                    )
 
                 else:
                     st.error(f"❌ Failed to delete your account: {result['error']}")
-                    st.info("Please try again or contact support if the problem persists.")
+                    if "auth_deleted" in result:
+                        show_deletion_summary(result)
+
+                    if result.get("auth_deleted"):
+                        st.warning(
+                            "Your login has already been removed, so you won't be able to sign in again. "
+                            "Please retry now without leaving this page, or contact support to finish removing your data."
+                        )
+                    else:
+                        st.info("Please try again or contact support if the problem persists.")
 
 
 def sidebar_navigation():
@@ -572,17 +759,8 @@ def sidebar_navigation():
         st.markdown("# 🏆 Quizdom")
         st.markdown("### Navigation")
 
-        if st.button("🏠 Home", use_container_width=True):
-            st.session_state.page = "home"
-            # Clear auth session when going to home
-            for key in ['authenticated', 'user_uid', 'user_email', 'user_token']:
-                if key in st.session_state:
-                    del st.session_state[key]
-            st.rerun()
-
-        if st.button("🗑️ Delete Account", use_container_width=True):
-            st.session_state.page = "deletion"
-            st.rerun()
+        st.button("🏠 Home", use_container_width=True, on_click=go_home)
+        st.button("🗑️ Delete Account", use_container_width=True, on_click=go_to_deletion)
 
         st.markdown("---")
         st.markdown("*© 2025 Quizdom*")
@@ -591,7 +769,7 @@ def sidebar_navigation():
 def main():
     # Initialize Firebase
     try:
-        initialize_firebase()
+        get_db()
     except Exception as e:
         st.error(f"Failed to initialize Firebase: {e}")
         st.stop()